@@ -4,8 +4,16 @@
 
 import pygame
 import random
+import itertools
 import time
+from collections import OrderedDict, deque
 import math # For sine wave or other mathematical effects
+import numpy as np # For vectorized random artifact generation
+
+# --- Glow Helper ---
+# RGBA colors for a glow of `size` layers, listed outermost (faintest) first.
+def glow_ramp(color, size, alpha_step):
+    return [(*color[:3], min(255, (size - i) * alpha_step)) for i in range(size, 0, -1)]
 
 # --- CrtStyle Class ---
 # This class defines a single CRT theme with all its visual parameters.
@@ -47,6 +55,33 @@ class CrtStyle:
         self.horizontal_banding_alpha = horizontal_banding_alpha
         self.horizontal_banding_thickness = horizontal_banding_thickness
 
+        # Derived RGBA colors, computed once instead of in the draw code
+        self.body_highlight_rgba = (*snake_body_color[:3], 100)
+        self.scanline_rgba = (*scanline_color[:3], min(255, scanline_alpha))
+        self.scan_beam_rgba = (*font_color[:3], 30)
+        self.inner_glow_rgba = (*inner_glow_color[:3], 30)
+        self.band_rgba = (*font_color[:3], min(255, int(horizontal_banding_alpha)))
+        self.noise_rgba = (*font_color[:3], min(255, int(pixel_noise_alpha)))
+
+        # Glow ramps depend on the game's glow sizes, so the game builds them
+        self.food_glow_rgba = None
+        self.head_glow_rgba = None
+        self.body_glow_rgba = None
+        self.text_glow_rgba = None # Ramp per text color the style uses
+
+        # Pre-rendered surfaces for the static parts of the scene.
+        # These are built by the game once the display mode has been set.
+        self.border_cache = None
+        self.grid_cache = None
+        self.food_sprite = None
+        self.head_sprite = None
+        self.body_sprite = None
+        self.scanline_overlay = None
+        self.scan_beam = None
+        self.band_sprite = None
+        self.noise_sprite = None
+        self.has_artifacts = False # True if the style uses banding or pixel noise
+
 # --- Game Class (Equivalent to GamePanel.java) ---
 # This class manages the game logic, rendering, and CRT effects using Pygame.
 class SnakeGamePygame:
@@ -57,29 +92,59 @@ class SnakeGamePygame:
     DELAY_MS = 100 # Delay in milliseconds for game updates
     BORDER_SIZE = 20 # Thickness of the non-playable CRT border
     STYLE_CHANGE_SCORE_INTERVAL = 5 # Score interval to change CRT style
+    GAME_UPDATE = pygame.USEREVENT + 1 # Custom timer event for game updates
+    HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, GAME_UPDATE] # The only events the game listens to
+    FOOD_GLOW_SIZE = 8 # How far the food glow extends past the food cell
+    HEAD_GLOW_SIZE = 6 # How far the snake head glow extends past its cell
+    BODY_GLOW_SIZE = 3 # How far the snake body glow extends past its cell
+    TEXT_GLOW_SIZE = 4 # How far the text glow layers are offset from the text
+    TEXT_CACHE_SIZE = 256 # Max number of rendered text surfaces kept around
+
+    # --- Directions ---
+    # (dx, dy) per direction id: 0=U, 1=D, 2=L, 3=R.
+    # Opposite directions only differ in bit 0, so the reverse of d is d ^ 1.
+    DIR_UP, DIR_DOWN, DIR_LEFT, DIR_RIGHT = range(4)
+    DIRECTIONS = ((0, -UNIT_SIZE), (0, UNIT_SIZE), (-UNIT_SIZE, 0), (UNIT_SIZE, 0))
+    KEY_DIRECTIONS = {pygame.K_UP: DIR_UP, pygame.K_DOWN: DIR_DOWN,
+                      pygame.K_LEFT: DIR_LEFT, pygame.K_RIGHT: DIR_RIGHT}
 
     def __init__(self):
         pygame.init() # Initialize Pygame modules
         pygame.font.init() # Initialize font module
 
+        # Keep every other event type (mouse motion, window events, ...) out of the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self.HANDLED_EVENTS)
+
         self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
         pygame.display.set_caption("Retro Snake Game")
         self.clock = pygame.time.Clock() # To control game frame rate
+        self.title_font = pygame.font.SysFont("Courier New", 48, bold=True) # Used for the game over title
 
         self.random = random.Random() # Initialize random number generator
+        self.np_random = np.random.default_rng() # Vectorized generator for per-frame artifacts
+
+        # Rendered text surfaces, keyed by (font, text, color), least recently used first
+        self._text_cache = OrderedDict()
 
         # --- Game State Variables ---
-        self.snake = []
+        # The snake is stored as separate x/y coordinate deques, head first
+        self.snake_x = deque()
+        self.snake_y = deque()
+        self.body_cells = set() # (x, y) of every segment except the head, for O(1) lookups
         self.food = None
-        self.direction = 'R' # 'U', 'D', 'L', 'R'
+        self.dir_id = self.DIR_RIGHT # Index into DIRECTIONS
         self.running = False
         self.score = 0
         self.high_score = 0
         self.game_start_time = 0
 
-        # For ghosting effect - we'll keep a history of previous frames
-        self.ghosting_frames = []
-        self.max_ghosting_frames = 5  # Number of frames to keep for ghosting
+        # Set whenever the game state changes and the scene has to be redrawn
+        self.dirty = True
+        self._last_clock_state = None
+
+        # Off-screen surface each frame is composed on, in the display's pixel format
+        self.frame_surface = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT)).convert()
 
         # --- Dynamic CRT Styles ---
         self.crt_styles = []
@@ -163,30 +228,102 @@ class SnakeGamePygame:
             horizontal_banding_alpha=0.0, horizontal_banding_thickness=0
         ))
 
+        # Pre-render everything that never changes for a given style
+        for style in self.crt_styles:
+            self._build_style_caches(style)
+
+    def _build_style_caches(self, style):
+        # Glow ramps have one color per layer, so they follow the glow sizes
+        style.food_glow_rgba = glow_ramp(style.food_glow_color, self.FOOD_GLOW_SIZE, 25)
+        style.head_glow_rgba = glow_ramp(style.snake_head_color, self.HEAD_GLOW_SIZE, 40)
+        style.body_glow_rgba = glow_ramp(style.snake_body_color, self.BODY_GLOW_SIZE, 60)
+        style.text_glow_rgba = {color: self._text_glow_ramp(color)
+                                for color in (style.font_color, style.game_over_color, style.restart_text_color)}
+
+        # The border and grid are fully static, so render them once per style
+        # and just blit the result every frame.
+        border_surface = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self._render_screen_border(border_surface, style)
+        style.border_cache = border_surface
+
+        # The grid cache is opaque and includes the background fill, so it
+        # replaces the per-frame fill with a single plain copy
+        grid_surface = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT)).convert()
+        grid_surface.fill(style.background_color)
+        self._render_grid(grid_surface, style)
+        style.grid_cache = grid_surface
+
+        # Food glow halo and core are identical every frame, so composite them once
+        food_surface = pygame.Surface((self.UNIT_SIZE + self.FOOD_GLOW_SIZE * 2,
+                                       self.UNIT_SIZE + self.FOOD_GLOW_SIZE * 2), pygame.SRCALPHA).convert_alpha()
+        self._render_food(food_surface, style)
+        style.food_sprite = food_surface
+
+        # Same for the snake: every head and body segment looks the same
+        head_surface = pygame.Surface((self.UNIT_SIZE + self.HEAD_GLOW_SIZE * 2,
+                                       self.UNIT_SIZE + self.HEAD_GLOW_SIZE * 2), pygame.SRCALPHA).convert_alpha()
+        self._render_snake_head(head_surface, style)
+        style.head_sprite = head_surface
+
+        body_surface = pygame.Surface((self.UNIT_SIZE + self.BODY_GLOW_SIZE * 2,
+                                       self.UNIT_SIZE + self.BODY_GLOW_SIZE * 2), pygame.SRCALPHA).convert_alpha()
+        self._render_snake_body(body_surface, style)
+        style.body_sprite = body_surface
+
+        # Static scanlines, plus the strip used for the moving beam
+        scanline_surface = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT), pygame.SRCALPHA)
+        for i in range(0, self.SCREEN_HEIGHT, 3):
+            pygame.draw.line(scanline_surface, style.scanline_rgba, 
+                           (0, i), (self.SCREEN_WIDTH, i), 1)
+        style.scanline_overlay = scanline_surface.convert_alpha()
+
+        beam_surface = pygame.Surface((self.SCREEN_WIDTH, 2), pygame.SRCALPHA)
+        beam_surface.fill(style.scan_beam_rgba)
+        style.scan_beam = beam_surface.convert_alpha()
+
+        # Artifact sprites, only for the styles that use them
+        if style.horizontal_banding_alpha > 0 and style.horizontal_banding_thickness > 0:
+            band_surface = pygame.Surface((self.SCREEN_WIDTH - self.BORDER_SIZE * 2, 
+                                         style.horizontal_banding_thickness), 
+                                        pygame.SRCALPHA)
+            band_surface.fill(style.band_rgba)
+            style.band_sprite = band_surface.convert_alpha()
+
+        if style.pixel_noise_density > 0 and style.pixel_noise_alpha > 0:
+            pixel_size = self.UNIT_SIZE // 2
+            noise_surface = pygame.Surface((pixel_size, pixel_size), pygame.SRCALPHA)
+            noise_surface.fill(style.noise_rgba)
+            style.noise_sprite = noise_surface.convert_alpha()
+
+        style.has_artifacts = style.band_sprite is not None or style.noise_sprite is not None
+
     def start_game(self):
         # Reset game variables to initial state
-        self.snake = []
+        self.snake_x = deque()
+        self.snake_y = deque()
+        self.body_cells = set()
         # Initial snake position centered in the playable area
         start_x = (self.SCREEN_WIDTH // 2)
         start_y = (self.SCREEN_HEIGHT // 2)
         start_x = ((start_x - self.BORDER_SIZE) // self.UNIT_SIZE) * self.UNIT_SIZE + self.BORDER_SIZE
         start_y = ((start_y - self.BORDER_SIZE) // self.UNIT_SIZE) * self.UNIT_SIZE + self.BORDER_SIZE
 
-        self.snake.append(pygame.Rect(start_x, start_y, self.UNIT_SIZE, self.UNIT_SIZE))
-        self.snake.append(pygame.Rect(start_x - self.UNIT_SIZE, start_y, self.UNIT_SIZE, self.UNIT_SIZE))
-        self.snake.append(pygame.Rect(start_x - self.UNIT_SIZE * 2, start_y, self.UNIT_SIZE, self.UNIT_SIZE))
+        for i in range(3):
+            self.snake_x.append(start_x - self.UNIT_SIZE * i)
+            self.snake_y.append(start_y)
+            if i > 0:
+                self.body_cells.add((start_x - self.UNIT_SIZE * i, start_y))
 
-        self.direction = 'R'
+        self.dir_id = self.DIR_RIGHT
         self.score = 0
         self.current_style_index = 0 # Reset style to the first one
         self.current_style = self.crt_styles[self.current_style_index]
         self.new_food()
         self.running = True
         self.game_start_time = time.time()
-        self.ghosting_frames = []  # Clear ghosting frames
+        self.dirty = True
 
-        # Set up a custom event for game updates (equivalent to Java's Timer)
-        self.GAME_UPDATE = pygame.USEREVENT + 1
+        # Start the timer for game updates (equivalent to Java's Timer)
         pygame.time.set_timer(self.GAME_UPDATE, self.DELAY_MS)
 
     def new_food(self):
@@ -202,32 +339,27 @@ class SnakeGamePygame:
             self.food = pygame.Rect(food_x, food_y, self.UNIT_SIZE, self.UNIT_SIZE)
             
             # Ensure food doesn't spawn on the snake
-            if not any(segment.colliderect(self.food) for segment in self.snake):
+            if (food_x, food_y) not in self.body_cells and (food_x, food_y) != (self.snake_x[0], self.snake_y[0]):
                 break
 
     def move(self):
-        head = self.snake[0]
-        
         # Create a new head position based on current direction
-        if self.direction == 'U':
-            new_head_pos = head.move(0, -self.UNIT_SIZE)
-        elif self.direction == 'D':
-            new_head_pos = head.move(0, self.UNIT_SIZE)
-        elif self.direction == 'L':
-            new_head_pos = head.move(-self.UNIT_SIZE, 0)
-        elif self.direction == 'R':
-            new_head_pos = head.move(self.UNIT_SIZE, 0)
-        else:
-            new_head_pos = head # Should not happen
+        dx, dy = self.DIRECTIONS[self.dir_id]
+        old_head = (self.snake_x[0], self.snake_y[0])
+        head_x = old_head[0] + dx
+        head_y = old_head[1] + dy
 
-        self.snake.insert(0, new_head_pos) # Add new head
+        # Add new head; the old head becomes part of the body
+        self.snake_x.appendleft(head_x)
+        self.snake_y.appendleft(head_y)
+        self.body_cells.add(old_head)
 
         # Remove tail unless food was just eaten
-        if not new_head_pos.colliderect(self.food):
-            self.snake.pop()
+        if (head_x, head_y) != (self.food.x, self.food.y):
+            self.body_cells.discard((self.snake_x.pop(), self.snake_y.pop()))
 
     def check_food(self):
-        if self.snake[0].colliderect(self.food):
+        if (self.snake_x[0], self.snake_y[0]) == (self.food.x, self.food.y):
             self.score += 1
             self.high_score = max(self.high_score, self.score)
 
@@ -239,92 +371,112 @@ class SnakeGamePygame:
             self.new_food()
 
     def check_collisions(self):
-        head = self.snake[0]
+        head_x = self.snake_x[0]
+        head_y = self.snake_y[0]
 
         # Wall collisions (within the playable border)
-        if (head.left < self.BORDER_SIZE or
-            head.right > self.SCREEN_WIDTH - self.BORDER_SIZE or
-            head.top < self.BORDER_SIZE or
-            head.bottom > self.SCREEN_HEIGHT - self.BORDER_SIZE):
+        if (head_x < self.BORDER_SIZE or
+            head_x + self.UNIT_SIZE > self.SCREEN_WIDTH - self.BORDER_SIZE or
+            head_y < self.BORDER_SIZE or
+            head_y + self.UNIT_SIZE > self.SCREEN_HEIGHT - self.BORDER_SIZE):
             self.running = False
 
-        # Self-collision
-        for segment in self.snake[1:]: # Check head against all body segments
-            if head.colliderect(segment):
-                self.running = False
-                break
+        # Self-collision: check head against all body segments
+        if (head_x, head_y) in self.body_cells:
+            self.running = False
         
         if not self.running:
             pygame.time.set_timer(self.GAME_UPDATE, 0) # Stop the game update timer
 
     def draw(self):
-        # Create a temporary surface for this frame
-        frame_surface = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
-        frame_surface.fill(self.current_style.background_color)
+        # The scene only changes on game ticks and a few timers, so rebuild
+        # it only when needed and otherwise just re-composite the last one
+        clock_state = self._frame_clock_state()
+        if clock_state != self._last_clock_state:
+            self._last_clock_state = clock_state
+            self.dirty = True
 
-        # Draw background artifacts
-        self._draw_background_artifacts(frame_surface)
+        if self.dirty:
+            self._draw_static_composite()
+            self.dirty = False
+
+        self._compose_dynamic()
+
+        pygame.display.flip() # Update the full display Surface to the screen
+
+    def _frame_clock_state(self):
+        # The TIME counter changes every second and the restart text blinks
+        # every half second; either one means the scene has to be redrawn
+        current_time = time.time()
+        return int(current_time - self.game_start_time), int(current_time * 2) % 2
+
+    def _draw_static_composite(self):
+        # Reuse the same surface for every frame
+        frame_surface = self.frame_surface
 
         if self.running:
-            self._draw_grid(frame_surface)
+            self._draw_grid(frame_surface) # Also clears the frame to the background color
             self._draw_food(frame_surface)
             self._draw_snake(frame_surface)
             self._draw_score_and_info(frame_surface)
         else:
+            frame_surface.fill(self.current_style.background_color)
             self._draw_game_over(frame_surface)
 
-        # Add this frame to our ghosting frames
-        self.ghosting_frames.append(frame_surface.copy())
-        if len(self.ghosting_frames) > self.max_ghosting_frames:
-            self.ghosting_frames.pop(0)
-
-        # Clear the screen
-        self.screen.fill((0, 0, 0))
+    def _compose_dynamic(self):
+        frame_surface = self.frame_surface
+        style = self.current_style
 
-        # Draw all ghosting frames with decreasing alpha
-        for i, ghost_frame in enumerate(self.ghosting_frames):
-            alpha = self.current_style.ghosting_alpha * (1 - (i / len(self.ghosting_frames)))
-            ghost_frame.set_alpha(alpha)
-            self.screen.blit(ghost_frame, (0, 0))
-
-        # Draw the current frame on top
+        # The frame is opaque and covers the whole screen, so it also clears it.
+        # No ghost trail is drawn under it: it would always be fully hidden, so
+        # the style's ghosting_alpha has no visible effect.
         self.screen.blit(frame_surface, (0, 0))
 
-        # Apply scanlines to the final composition
-        self._draw_scanlines()
-
-        # Draw the CRT border last
-        self._draw_screen_border()
-
-        pygame.display.flip() # Update the full display Surface to the screen
+        # From here on, effects whose style parameters make them invisible are skipped
+
+        # Background artifacts are random every frame
+        if style.has_artifacts:
+            self._draw_background_artifacts(self.screen)
+
+        # Then the scanlines (static and moving) and finally the CRT border
+        overlays = []
+        scan_y = self._scan_beam_y()
+        if style.scanline_alpha > 0:
+            # Leave out the scanline rows under the moving beam, which replaces
+            # them instead of blending on top
+            beam_bottom = scan_y + style.scan_beam.get_height()
+            overlays.append((style.scanline_overlay, (0, 0), (0, 0, self.SCREEN_WIDTH, scan_y)))
+            overlays.append((style.scanline_overlay, (0, beam_bottom),
+                             (0, beam_bottom, self.SCREEN_WIDTH, max(0, self.SCREEN_HEIGHT - beam_bottom))))
+        overlays.append((style.scan_beam, (0, scan_y)))
+        overlays.append((style.border_cache, (0, 0)))
+        self.screen.blits(overlays, doreturn=False)
 
     def _draw_background_artifacts(self, surface):
+        style = self.current_style
+
         # --- Horizontal Banding (for IBM style) ---
-        if self.current_style.horizontal_banding_alpha > 0 and self.current_style.horizontal_banding_thickness > 0:
-            band_color = (*self.current_style.font_color[:3], min(255, self.current_style.horizontal_banding_alpha))
-            band_surface = pygame.Surface((self.SCREEN_WIDTH - self.BORDER_SIZE * 2, 
-                                         self.current_style.horizontal_banding_thickness), 
-                                        pygame.SRCALPHA)
-            band_surface.fill(band_color)
-            
-            for i in range(self.BORDER_SIZE, self.SCREEN_HEIGHT - self.BORDER_SIZE, self.UNIT_SIZE // 2):
-                if self.random.random() < 0.1: # Random chance to draw a band
-                    surface.blit(band_surface, (self.BORDER_SIZE, i))
+        if style.band_sprite is not None:
+            band_spacing = self.UNIT_SIZE // 2
+            rows = (self.SCREEN_HEIGHT - self.BORDER_SIZE * 2 + band_spacing - 1) // band_spacing
+            band_rows = np.flatnonzero(self.np_random.random(rows) < 0.1) # Random chance to draw a band
+            surface.blits([(style.band_sprite, (self.BORDER_SIZE, self.BORDER_SIZE + int(i) * band_spacing))
+                           for i in band_rows], doreturn=False)
 
         # --- Chunky Pixel Noise (for Commodore style) ---
-        if self.current_style.pixel_noise_density > 0 and self.current_style.pixel_noise_alpha > 0:
+        if style.noise_sprite is not None:
             pixel_size = self.UNIT_SIZE // 2
-            noise_surface = pygame.Surface((pixel_size, pixel_size), pygame.SRCALPHA)
-            noise_surface.fill((*self.current_style.font_color[:3], 
-                              min(255, self.current_style.pixel_noise_alpha)))
-            
-            for x in range(self.BORDER_SIZE, self.SCREEN_WIDTH - self.BORDER_SIZE, pixel_size):
-                for y in range(self.BORDER_SIZE, self.SCREEN_HEIGHT - self.BORDER_SIZE, pixel_size):
-                    if self.random.random() < self.current_style.pixel_noise_density:
-                        surface.blit(noise_surface, (x, y))
+            nx = (self.SCREEN_WIDTH - self.BORDER_SIZE * 2 + pixel_size - 1) // pixel_size
+            ny = (self.SCREEN_HEIGHT - self.BORDER_SIZE * 2 + pixel_size - 1) // pixel_size
+            noise_cells = np.argwhere(self.np_random.random((nx, ny)) < style.pixel_noise_density)
+            surface.blits([(style.noise_sprite, (self.BORDER_SIZE + int(i) * pixel_size, self.BORDER_SIZE + int(j) * pixel_size))
+                           for i, j in noise_cells], doreturn=False)
 
     def _draw_grid(self, surface):
-        grid_color = self.current_style.grid_color
+        surface.blit(self.current_style.grid_cache, (0, 0))
+
+    def _render_grid(self, surface, style):
+        grid_color = style.grid_color
         # Draw vertical lines
         for i in range(self.BORDER_SIZE, self.SCREEN_WIDTH - self.BORDER_SIZE, self.UNIT_SIZE):
             pygame.draw.line(surface, grid_color, (i, self.BORDER_SIZE), (i, self.SCREEN_HEIGHT - self.BORDER_SIZE))
@@ -333,80 +485,116 @@ class SnakeGamePygame:
             pygame.draw.line(surface, grid_color, (self.BORDER_SIZE, i), (self.SCREEN_WIDTH - self.BORDER_SIZE, i))
 
     def _draw_food(self, surface):
+        surface.blit(self.current_style.food_sprite,
+                     (self.food.x - self.FOOD_GLOW_SIZE, self.food.y - self.FOOD_GLOW_SIZE))
+
+    def _render_food(self, surface, style):
+        # The food sits in the middle of the sprite, surrounded by its glow
+        food = pygame.Rect(self.FOOD_GLOW_SIZE, self.FOOD_GLOW_SIZE, self.UNIT_SIZE, self.UNIT_SIZE)
+
         # Draw glow effect for food
-        for i in range(8, 0, -1):
-            alpha = min(255, (8 - i) * 25)  # 25, 50, 75, ..., 200
+        for i, glow_color in zip(range(self.FOOD_GLOW_SIZE, 0, -1), style.food_glow_rgba):
             glow_surface = pygame.Surface((self.UNIT_SIZE + i * 2, self.UNIT_SIZE + i * 2), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (*self.current_style.food_glow_color[:3], alpha), 
+            pygame.draw.circle(glow_surface, glow_color, 
                              (glow_surface.get_width() // 2, glow_surface.get_height() // 2), 
                              (self.UNIT_SIZE + i * 2) // 2)
-            surface.blit(glow_surface, (self.food.x - i, self.food.y - i))
+            surface.blit(glow_surface, (food.x - i, food.y - i))
 
         # Draw main food
-        pygame.draw.circle(surface, self.current_style.food_color, 
-                         (self.food.centerx, self.food.centery), self.UNIT_SIZE // 2)
+        pygame.draw.circle(surface, style.food_color, 
+                         (food.centerx, food.centery), self.UNIT_SIZE // 2)
         
         # Add bright center
         bright_food_center = (
-            min(255, self.current_style.food_color[0] + 50),
-            min(255, self.current_style.food_color[1] + 50),
-            min(255, self.current_style.food_color[2] + 50)
+            min(255, style.food_color[0] + 50),
+            min(255, style.food_color[1] + 50),
+            min(255, style.food_color[2] + 50)
         )
         pygame.draw.circle(surface, bright_food_center, 
-                         (self.food.centerx, self.food.centery), (self.UNIT_SIZE - 8) // 2)
+                         (food.centerx, food.centery), (self.UNIT_SIZE - 8) // 2)
 
     def _draw_snake(self, surface):
-        for i, segment in enumerate(self.snake):
-            if i == 0:
-                # Snake head with bright glow
-                for j in range(6, 0, -1):
-                    alpha = min(255, (6 - j) * 40)  # 40, 80, 120, ..., 200
-                    glow_surface = pygame.Surface((self.UNIT_SIZE + j * 2, self.UNIT_SIZE + j * 2), pygame.SRCALPHA)
-                    pygame.draw.rect(glow_surface, (*self.current_style.snake_head_color[:3], alpha), 
-                                     glow_surface.get_rect(), border_radius=self.UNIT_SIZE // 4)
-                    surface.blit(glow_surface, (segment.x - j, segment.y - j))
-                
-                pygame.draw.rect(surface, self.current_style.snake_head_color, segment, border_radius=self.UNIT_SIZE // 4)
-                
-                # Eyes (using background color to appear "cut out")
-                pygame.draw.rect(surface, self.current_style.background_color, (segment.x + 3, segment.y + 3, 4, 4))
-                pygame.draw.rect(surface, self.current_style.background_color, (segment.x + 13, segment.y + 3, 4, 4))
-            else:
-                # Snake body with subtle glow
-                for j in range(3, 0, -1):
-                    alpha = min(255, (3 - j) * 60)  # 60, 120, 180
-                    glow_surface = pygame.Surface((self.UNIT_SIZE + j * 2, self.UNIT_SIZE + j * 2), pygame.SRCALPHA)
-                    pygame.draw.rect(glow_surface, (*self.current_style.snake_body_color[:3], alpha), 
-                                     glow_surface.get_rect(), border_radius=self.UNIT_SIZE // 4)
-                    surface.blit(glow_surface, (segment.x - j, segment.y - j))
-
-                pygame.draw.rect(surface, self.current_style.snake_body_color, segment, border_radius=self.UNIT_SIZE // 4)
-                
-                # Add inner highlight
-                highlight_surface = pygame.Surface((self.UNIT_SIZE - 4, self.UNIT_SIZE - 4), pygame.SRCALPHA)
-                highlight_surface.fill((*self.current_style.snake_body_color[:3], 100))
-                surface.blit(highlight_surface, (segment.x + 2, segment.y + 2))
+        style = self.current_style
+        surface.blit(style.head_sprite, (self.snake_x[0] - self.HEAD_GLOW_SIZE, self.snake_y[0] - self.HEAD_GLOW_SIZE))
+
+        # Body segments are drawn after the head so their glow overlaps it, as before
+        body = zip(itertools.islice(self.snake_x, 1, None), itertools.islice(self.snake_y, 1, None))
+        surface.blits([(style.body_sprite, (x - self.BODY_GLOW_SIZE, y - self.BODY_GLOW_SIZE))
+                       for x, y in body], doreturn=False)
+
+    def _render_snake_head(self, surface, style):
+        segment = pygame.Rect(self.HEAD_GLOW_SIZE, self.HEAD_GLOW_SIZE, self.UNIT_SIZE, self.UNIT_SIZE)
+
+        # Snake head with bright glow
+        for j, glow_color in zip(range(self.HEAD_GLOW_SIZE, 0, -1), style.head_glow_rgba):
+            glow_surface = pygame.Surface((self.UNIT_SIZE + j * 2, self.UNIT_SIZE + j * 2), pygame.SRCALPHA)
+            pygame.draw.rect(glow_surface, glow_color, 
+                             glow_surface.get_rect(), border_radius=self.UNIT_SIZE // 4)
+            surface.blit(glow_surface, (segment.x - j, segment.y - j))
+        
+        pygame.draw.rect(surface, style.snake_head_color, segment, border_radius=self.UNIT_SIZE // 4)
+        
+        # Eyes (using background color to appear "cut out")
+        pygame.draw.rect(surface, style.background_color, (segment.x + 3, segment.y + 3, 4, 4))
+        pygame.draw.rect(surface, style.background_color, (segment.x + 13, segment.y + 3, 4, 4))
+
+    def _render_snake_body(self, surface, style):
+        segment = pygame.Rect(self.BODY_GLOW_SIZE, self.BODY_GLOW_SIZE, self.UNIT_SIZE, self.UNIT_SIZE)
+
+        # Snake body with subtle glow
+        for j, glow_color in zip(range(self.BODY_GLOW_SIZE, 0, -1), style.body_glow_rgba):
+            glow_surface = pygame.Surface((self.UNIT_SIZE + j * 2, self.UNIT_SIZE + j * 2), pygame.SRCALPHA)
+            pygame.draw.rect(glow_surface, glow_color, 
+                             glow_surface.get_rect(), border_radius=self.UNIT_SIZE // 4)
+            surface.blit(glow_surface, (segment.x - j, segment.y - j))
+
+        pygame.draw.rect(surface, style.snake_body_color, segment, border_radius=self.UNIT_SIZE // 4)
+        
+        # Add inner highlight
+        highlight_surface = pygame.Surface((self.UNIT_SIZE - 4, self.UNIT_SIZE - 4), pygame.SRCALPHA)
+        highlight_surface.fill(style.body_highlight_rgba)
+        surface.blit(highlight_surface, (segment.x + 2, segment.y + 2))
+
+    def _render_text(self, text, color, font=None):
+        # Rendering TTF text is expensive and the same strings are drawn every
+        # frame, so keep the rendered surfaces in a small LRU cache.
+        if font is None:
+            font = self.current_style.crt_font
+        key = (font, text, color)
+        rendered = self._text_cache.get(key)
+        if rendered is None:
+            rendered = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = rendered
+            if len(self._text_cache) > self.TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return rendered
+
+    def _text_glow_ramp(self, color):
+        return glow_ramp(color, self.TEXT_GLOW_SIZE, 50)
 
     def _draw_text_with_glow(self, surface, text, x, y, base_color):
-        # Render text with Pygame's font.render
-        rendered_text = self.current_style.crt_font.render(text, True, base_color)
-
-        # Draw multiple layers for glow
-        for i in range(4, 0, -1):
-            alpha = min(255, (4 - i) * 50)  # 50, 100, 150, 200
-            glow_color = (*base_color[:3], alpha)
-            glow_surface = self.current_style.crt_font.render(text, True, glow_color)
-            surface.blit(glow_surface, (x - i, y - i))
-            surface.blit(glow_surface, (x + i, y + i))
-            surface.blit(glow_surface, (x - i, y + i))
-            surface.blit(glow_surface, (x + i, y - i))
+        blit_sequence = []
+
+        # Draw multiple layers for glow; the style's text colors have their ramps precomputed
+        glow_colors = self.current_style.text_glow_rgba.get(base_color)
+        if glow_colors is None:
+            glow_colors = self._text_glow_ramp(base_color)
+        for i, glow_color in zip(range(self.TEXT_GLOW_SIZE, 0, -1), glow_colors):
+            glow_surface = self._render_text(text, glow_color)
+            blit_sequence.append((glow_surface, (x - i, y - i)))
+            blit_sequence.append((glow_surface, (x + i, y + i)))
+            blit_sequence.append((glow_surface, (x - i, y + i)))
+            blit_sequence.append((glow_surface, (x + i, y - i)))
         
         # Draw main text
-        surface.blit(rendered_text, (x, y))
+        blit_sequence.append((self._render_text(text, base_color), (x, y)))
 
         # Add bright core
-        bright_core_surface = self.current_style.crt_font.render(text, True, (255, 255, 255, 180))
-        surface.blit(bright_core_surface, (x, y))
+        blit_sequence.append((self._render_text(text, (255, 255, 255, 180)), (x, y)))
+
+        surface.blits(blit_sequence, doreturn=False)
 
     def _draw_score_and_info(self, surface):
         score_text = f"SCORE: {self.score}"
@@ -418,26 +606,25 @@ class SnakeGamePygame:
         self._draw_text_with_glow(surface, high_score_text, 10 + self.BORDER_SIZE, 60 + self.BORDER_SIZE, self.current_style.font_color)
 
         # Position time on the right side
-        time_text_surface = self.current_style.crt_font.render(time_text, True, self.current_style.font_color)
+        time_text_surface = self._render_text(time_text, self.current_style.font_color)
         time_x = self.SCREEN_WIDTH - self.BORDER_SIZE - time_text_surface.get_width() - 10
         self._draw_text_with_glow(surface, time_text, time_x, 30 + self.BORDER_SIZE, self.current_style.font_color)
 
     def _draw_game_over(self, surface):
         # Game Over title
-        title_font = pygame.font.SysFont("Courier New", 48, bold=True)
         game_over_text = "GAME OVER"
-        rendered_title = title_font.render(game_over_text, True, self.current_style.game_over_color)
+        rendered_title = self._render_text(game_over_text, self.current_style.game_over_color, self.title_font)
         title_rect = rendered_title.get_rect(center=(self.SCREEN_WIDTH // 2, self.SCREEN_HEIGHT // 2 - 100))
         self._draw_text_with_glow(surface, game_over_text, title_rect.x, title_rect.y, self.current_style.game_over_color)
 
         # Final score
         final_score_text = f"FINAL SCORE: {self.score}"
-        rendered_final_score = self.current_style.crt_font.render(final_score_text, True, self.current_style.font_color)
+        rendered_final_score = self._render_text(final_score_text, self.current_style.font_color)
         score_rect = rendered_final_score.get_rect(center=(self.SCREEN_WIDTH // 2, self.SCREEN_HEIGHT // 2 + 30))
         self._draw_text_with_glow(surface, final_score_text, score_rect.x, score_rect.y, self.current_style.font_color)
 
         high_score_text = f"HIGH SCORE: {self.high_score}"
-        rendered_high_score = self.current_style.crt_font.render(high_score_text, True, self.current_style.font_color)
+        rendered_high_score = self._render_text(high_score_text, self.current_style.font_color)
         high_score_rect = rendered_high_score.get_rect(center=(self.SCREEN_WIDTH // 2, self.SCREEN_HEIGHT // 2 + 60))
         self._draw_text_with_glow(surface, high_score_text, high_score_rect.x, high_score_rect.y, self.current_style.font_color)
 
@@ -446,41 +633,28 @@ class SnakeGamePygame:
         current_time = time.time()
         # Blinking effect: render every other 0.5 second interval
         if int(current_time * 2) % 2 == 0:
-            rendered_restart_text = self.current_style.crt_font.render(restart_text, True, self.current_style.restart_text_color)
+            rendered_restart_text = self._render_text(restart_text, self.current_style.restart_text_color)
             restart_rect = rendered_restart_text.get_rect(center=(self.SCREEN_WIDTH // 2, self.SCREEN_HEIGHT // 2 + 120))
             self._draw_text_with_glow(surface, restart_text, restart_rect.x, restart_rect.y, self.current_style.restart_text_color)
 
-    def _draw_scanlines(self):
-        # Create a surface for scanlines
-        scanline_surface = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT), pygame.SRCALPHA)
-        
-        # Static scanlines
-        for i in range(0, self.SCREEN_HEIGHT, 3):
-            pygame.draw.line(scanline_surface, (*self.current_style.scanline_color[:3], 
-                            min(255, self.current_style.scanline_alpha)), 
-                           (0, i), (self.SCREEN_WIDTH, i), 1)
-        
-        # Moving scanline
+    def _scan_beam_y(self):
+        # Moving scanline position
         current_time_ms = pygame.time.get_ticks()
-        scan_y = int((current_time_ms / 10) % self.SCREEN_HEIGHT)
-        pygame.draw.line(scanline_surface, (*self.current_style.font_color[:3], 30),
-                        (0, scan_y), (self.SCREEN_WIDTH, scan_y), 2)
-        
-        self.screen.blit(scanline_surface, (0, 0))
+        return int((current_time_ms / 10) % self.SCREEN_HEIGHT)
 
-    def _draw_screen_border(self):
+    def _render_screen_border(self, surface, style):
         # Draw outer CRT bezel (non-playable area)
-        pygame.draw.rect(self.screen, self.current_style.bezel_color, 
+        pygame.draw.rect(surface, style.bezel_color, 
                          (0, 0, self.SCREEN_WIDTH, self.BORDER_SIZE), border_radius=15)
-        pygame.draw.rect(self.screen, self.current_style.bezel_color, 
+        pygame.draw.rect(surface, style.bezel_color, 
                          (0, self.SCREEN_HEIGHT - self.BORDER_SIZE, self.SCREEN_WIDTH, self.BORDER_SIZE), border_radius=15)
-        pygame.draw.rect(self.screen, self.current_style.bezel_color, 
+        pygame.draw.rect(surface, style.bezel_color, 
                          (0, 0, self.BORDER_SIZE, self.SCREEN_HEIGHT), border_radius=15)
-        pygame.draw.rect(self.screen, self.current_style.bezel_color, 
+        pygame.draw.rect(surface, style.bezel_color, 
                          (self.SCREEN_WIDTH - self.BORDER_SIZE, 0, self.BORDER_SIZE, self.SCREEN_HEIGHT), border_radius=15)
 
         # Draw CRT screen border (inner border)
-        pygame.draw.rect(self.screen, self.current_style.border_color, 
+        pygame.draw.rect(surface, style.border_color, 
                          (self.BORDER_SIZE - 2, self.BORDER_SIZE - 2, 
                           self.SCREEN_WIDTH - self.BORDER_SIZE * 2 + 4, 
                           self.SCREEN_HEIGHT - self.BORDER_SIZE * 2 + 4), 
@@ -490,34 +664,36 @@ class SnakeGamePygame:
         inner_glow_surface = pygame.Surface((self.SCREEN_WIDTH - self.BORDER_SIZE * 2, 
                                             self.SCREEN_HEIGHT - self.BORDER_SIZE * 2), 
                                            pygame.SRCALPHA)
-        pygame.draw.rect(inner_glow_surface, (*self.current_style.inner_glow_color[:3], 30),
+        pygame.draw.rect(inner_glow_surface, style.inner_glow_rgba,
                         (0, 0, inner_glow_surface.get_width(), inner_glow_surface.get_height()),
                         width=2, border_radius=10)
-        self.screen.blit(inner_glow_surface, (self.BORDER_SIZE, self.BORDER_SIZE))
+        surface.blit(inner_glow_surface, (self.BORDER_SIZE, self.BORDER_SIZE))
 
     def run(self):
         running_game = True
         while running_game:
+            ticked = False
+            # The queue only holds the handled events; getting them by type would
+            # group them by type and apply keys out of order with the ticks
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running_game = False
                 elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_LEFT:
-                        if self.direction != 'R': self.direction = 'L'
-                    elif event.key == pygame.K_RIGHT:
-                        if self.direction != 'L': self.direction = 'R'
-                    elif event.key == pygame.K_UP:
-                        if self.direction != 'D': self.direction = 'U'
-                    elif event.key == pygame.K_DOWN:
-                        if self.direction != 'U': self.direction = 'D'
+                    if event.key in self.KEY_DIRECTIONS:
+                        new_dir_id = self.KEY_DIRECTIONS[event.key]
+                        if new_dir_id ^ 1 != self.dir_id: self.dir_id = new_dir_id # No reversing
                     elif event.key == pygame.K_SPACE:
                         if not self.running:
                             self.start_game()
                 elif event.type == self.GAME_UPDATE: # Custom event for game updates
-                    if self.running:
+                    # If the loop stalled, several ticks may be queued; only the
+                    # first one updates, in queue order with the keys around it
+                    if self.running and not ticked:
                         self.move()
                         self.check_food()
                         self.check_collisions()
+                        self.dirty = True
+                    ticked = True
             
             self.draw()
             self.clock.tick(60) # Limit frame rate to 60 FPS